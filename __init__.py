@@ -7,8 +7,15 @@ import logging
 from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
 
+from .const import (
+    CONF_MODEL,
+    CONF_SUBSCRIPTIONS,
+    CONF_VERBOSITY,
+    SL_DEFAULT_VERBOSITY,
+    SL_VERBOSITY_LEVELS,
+)
 from .coordinator import SLConfigEntry, SLCoordinator
-from .device import SLDevice
+from .device import DEVICE_MODEL, SLDevice
 
 _PLATFORMS: list[Platform] = [
     Platform.MEDIA_PLAYER,
@@ -22,15 +29,40 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, entry: SLConfigEntry) -> bool:
     """Set up SL device from a config entry."""
 
-    dev = SLDevice(hass, entry.data[CONF_HOST])
+    verbosity = entry.options.get(CONF_VERBOSITY, SL_DEFAULT_VERBOSITY)
+    if verbosity not in SL_VERBOSITY_LEVELS:
+        verbosity = SL_DEFAULT_VERBOSITY
+    dev = SLDevice(
+        hass,
+        entry.data[CONF_HOST],
+        model=entry.data.get(CONF_MODEL),
+        verbosity=verbosity,
+        subscriptions=entry.options.get(CONF_SUBSCRIPTIONS),
+    )
     coord = SLCoordinator(hass, entry, dev)
     entry.runtime_data = coord
-    await coord.async_config_entry_first_refresh()
+    if CONF_MODEL in entry.data:
+        coord.async_schedule_start()
+    else:
+        # Older entries need one connection to learn the model for the ids.
+        await coord.async_config_entry_first_refresh()
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, CONF_MODEL: dev.get_data_value(DEVICE_MODEL)},
+        )
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: SLConfigEntry) -> None:
+    """Reload when the options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: SLConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, _PLATFORMS):
+        entry.runtime_data.device.close()
+    return unload_ok
@@ -7,13 +7,27 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import DOMAIN, SL_TITLE
-from .device import SLDevice
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    CONF_MODEL,
+    CONF_SUBSCRIPTIONS,
+    CONF_VERBOSITY,
+    DOMAIN,
+    SL_DEFAULT_VERBOSITY,
+    SL_TITLE,
+    SL_VERBOSITY_LEVELS,
+)
+from .device import DEVICE_MODEL, DEVICE_SUBS, SLDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,7 +39,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     dev = SLDevice(hass, data[CONF_HOST])
     if await dev.test_connection():
-        return {"title": SL_TITLE}
+        return {"title": SL_TITLE, CONF_MODEL: dev.get_data_value(DEVICE_MODEL)}
 
     raise CannotConnect
 
@@ -51,12 +65,47 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                return self.async_create_entry(title=info["title"], data=user_input)
+                return self.async_create_entry(
+                    title=info["title"],
+                    data={**user_input, CONF_MODEL: info[CONF_MODEL]},
+                )
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlowHandler:
+        """Get the options flow."""
+        return OptionsFlowHandler()
+
+
+class OptionsFlowHandler(OptionsFlow):
+    """Handle notification options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Pick verbosity and subscribed keys."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_VERBOSITY,
+                    default=options.get(CONF_VERBOSITY, SL_DEFAULT_VERBOSITY),
+                ): vol.In(SL_VERBOSITY_LEVELS),
+                vol.Required(
+                    CONF_SUBSCRIPTIONS,
+                    default=options.get(CONF_SUBSCRIPTIONS, list(DEVICE_SUBS)),
+                ): cv.multi_select(list(DEVICE_SUBS)),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -7,6 +7,23 @@ SL_EVENT = "SL_processor_event"
 
 SL_CONNECT_TIMEOUT = 20
 SL_LOGIN_TIMEOUT = 5
+SL_RETRY_INTERVAL = 30
+SL_BOOT_TIMEOUT = 30
+SL_HISTORY_SIZE = 256
+SL_METRICS_INTERVAL = 30
+SL_STATS_INTERVAL = 300
+SL_EVENT_INTERVAL = 0.5
+SL_EVENT_ORIGIN_WINDOW = 3
 SL_ZEROCONF_TIMEOUT = 5
 SL_PORT = 84
 SL_MIN_COMMAND_INTERVAL = 1
+
+CONF_MODEL = "model"
+CONF_SUBSCRIPTIONS = "subscriptions"
+CONF_VERBOSITY = "verbosity"
+SL_DEFAULT_VERBOSITY = 1
+# VERB(0) stops unsolicited notifications, POWER and entity updates need them.
+SL_VERBOSITY_LEVELS = (1, 2)
+
+EVENT_ORIGIN_EXTERNAL = "external"
+EVENT_ORIGIN_SELF = "self"
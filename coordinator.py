@@ -1,11 +1,14 @@
 """Coordinator."""
 
+import asyncio
 import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .const import SL_RETRY_INTERVAL
 from .device import SLDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,6 +34,7 @@ class SLCoordinator(DataUpdateCoordinator):
             always_update=False,
         )
         self._device = device
+        self._start_task: asyncio.Task | None = None
 
     @property
     def device(self) -> SLDevice:
@@ -40,7 +44,43 @@ class SLCoordinator(DataUpdateCoordinator):
     async def async_init(self):
         """Init the device."""
         _LOGGER.debug("async_init")
-        await self.device.async_init(self.update_callback)
+        await self.device.async_init(self.update_callback, self.lost_callback)
+
+    @callback
+    def async_schedule_start(self, unavailable: bool = False) -> None:
+        """Run async_start as an entry background task, once at a time."""
+        if self._start_task is not None and not self._start_task.done():
+            return
+        self._start_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self.async_start(unavailable),
+            f"SL setup {self.device.device_id}",
+        )
+
+    @callback
+    def lost_callback(self):
+        """Connection dropped, reconnect in the background."""
+        self.async_schedule_start(unavailable=True)
+
+    async def async_start(self, unavailable: bool = False):
+        """Connect and init in the background until the device answers."""
+        start = time.monotonic()
+        while True:
+            try:
+                await self.async_init()
+                break
+            except (ConnectionError, TimeoutError) as err:
+                if not unavailable:
+                    _LOGGER.warning(
+                        "Device %s is unavailable: %s", self.device.device_id, err
+                    )
+                    unavailable = True
+                await asyncio.sleep(SL_RETRY_INTERVAL)
+        if unavailable:
+            _LOGGER.info("Device %s is back online", self.device.device_id)
+        self.device.metrics.init_time = time.monotonic() - start
+        _LOGGER.debug("init took %.3fs", self.device.metrics.init_time)
+        self.async_set_updated_data(self.device.data)
 
     async def async_update(self):
         """Don't poll."""
@@ -51,4 +91,10 @@ class SLCoordinator(DataUpdateCoordinator):
     @callback
     def update_callback(self, data):
         """Incoming data callback."""
-        self.hass.add_job(self.async_set_updated_data, data)
+        self.hass.add_job(self.async_dispatch, data, time.perf_counter())
+
+    @callback
+    def async_dispatch(self, data, queued: float):
+        """Push data to the entities and time it from when it was queued."""
+        self.async_set_updated_data(data)
+        self.device.metrics.dispatch_latency.record(time.perf_counter() - queued)
@@ -1,12 +1,30 @@
 """Stewart SL Device."""
 
 import asyncio
+from collections.abc import Callable, Iterable
 import logging
 import re
+import time
 
 from homeassistant.core import HomeAssistant, callback
 
-from .const import SL_CONNECT_TIMEOUT, SL_LOGIN_TIMEOUT, SL_PORT
+from .const import (
+    EVENT_ORIGIN_EXTERNAL,
+    EVENT_ORIGIN_SELF,
+    SL_BOOT_TIMEOUT,
+    SL_CONNECT_TIMEOUT,
+    SL_DEFAULT_VERBOSITY,
+    SL_EVENT,
+    SL_EVENT_INTERVAL,
+    SL_EVENT_ORIGIN_WINDOW,
+    SL_HISTORY_SIZE,
+    SL_LOGIN_TIMEOUT,
+    SL_PORT,
+)
+from .events import SLEventThrottle
+from .history import SLHistory
+from .metrics import SLMetrics
+from .transport import SLProtocol
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +38,8 @@ DEVICE_MUTE = "MUTE"
 DEVICE_MUTEOFF = "MUTEOFF"
 DEVICE_MUTEON = "MUTEON"
 DEVICE_POWER = "POWER"
+DEVICE_POWER_OFF = "POWEROFFMAIN"
+DEVICE_POWER_ON = "POWERONMAIN"
 DEVICE_SOURCE = "SRC"
 DEVICE_SOURCES = "SRCS"
 DEVICE_SOURCE_COUNT = "SRCCOUNT"
@@ -42,26 +62,140 @@ DEVICE_SUBS = (
     DEVICE_VOL
 )
 
+# Keys whose transitions are kept in the history rings.
+DEVICE_HISTORY_KEYS = (
+    DEVICE_AUDIO_MODE,
+    DEVICE_AUDIO_TYPE,
+    DEVICE_SOURCE,
+    DEVICE_VIDEO_TYPE,
+)
+
+# Keys that fire SL_EVENT when they change.
+DEVICE_EVENT_KEYS = (
+    DEVICE_AUDIO_MODE,
+    DEVICE_MUTE,
+    DEVICE_POWER,
+    DEVICE_SOURCE,
+    DEVICE_VOICING,
+    DEVICE_VOL,
+)
+
+# Commands that report back under another key and value.
+DEVICE_COMMAND_ECHOES = {
+    DEVICE_MUTEOFF: (DEVICE_MUTE, DEVICE_MUTEOFF),
+    DEVICE_MUTEON: (DEVICE_MUTE, DEVICE_MUTEON),
+    DEVICE_POWER_OFF: (DEVICE_POWER, "0"),
+    DEVICE_POWER_ON: (DEVICE_POWER, "1"),
+}
+
+# Catalog list key -> (count method, entry method).
+DEVICE_CATALOGS = {
+    DEVICE_SOURCES: (DEVICE_SOURCE_COUNT, DEVICE_SOURCE),
+    DEVICE_AUDIO_MODES: (DEVICE_AUDIO_MODE_COUNT, DEVICE_AUDIO_MODE),
+    DEVICE_VOICINGS: (DEVICE_VOICING_COUNT, DEVICE_VOICING),
+}
+DEVICE_CATALOG_COUNTS = {count: key for key, (count, _) in DEVICE_CATALOGS.items()}
+DEVICE_CATALOG_ENTRIES = {entry: key for key, (_, entry) in DEVICE_CATALOGS.items()}
+
+# Keys that are always delivered, whatever the subscription.
+DEVICE_REQUIRED_SUBS = (DEVICE_POWER,)
+
+# Keys that arrive under a different method name.
+DEVICE_SUB_ALIASES = {DEVICE_MUTE: (DEVICE_MUTEOFF, DEVICE_MUTEON)}
+
+DEVICE_KNOWN_METHODS = frozenset(
+    (
+        *DEVICE_SUBS,
+        DEVICE_AUDIO_MODE_COUNT,
+        DEVICE_MODEL,
+        DEVICE_MUTEOFF,
+        DEVICE_MUTEON,
+        DEVICE_SOURCE_COUNT,
+        DEVICE_VOICING_COUNT,
+    )
+)
+
+POWER_STATE_OFF = "off"
+POWER_STATE_BOOTING = "booting"
+POWER_STATE_READY = "ready"
+
+# Commands the processor drops while it is still booting.
+DEVICE_READY_METHODS = (
+    DEVICE_AUDIO_MODE,
+    DEVICE_LIPSYNC,
+    DEVICE_MUTEOFF,
+    DEVICE_MUTEON,
+    DEVICE_SOURCE,
+    DEVICE_VOICING,
+    DEVICE_VOL
+)
+
+DEVICE_MAX_CATALOG = 256
+
+
+def parse_int(data: str | None) -> int | None:
+    """Parse a protocol number, None if it is not one."""
+    try:
+        return int(data)
+    except (TypeError, ValueError):
+        return None
+
+
 class SLDevice:
     """Represents a single SL device."""
 
-    def __init__(self, hass: HomeAssistant, host: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        model: str | None = None,
+        verbosity: int = SL_DEFAULT_VERBOSITY,
+        subscriptions: list[str] | None = None,
+        port: int = SL_PORT,
+    ) -> None:
         """Set up class."""
 
         self._hass = hass
         self._host = host
-        self._device_id = None
-        self._reader: asyncio.StreamReader
-        self._writer: asyncio.StreamWriter
+        self._port = port
+        self._verbosity = verbosity
+        self._subscriptions = tuple(
+            DEVICE_SUBS if subscriptions is None else subscriptions
+        )
+        self._sub_re = self.build_sub_re(self._subscriptions)
+        self._known_re = self.build_method_re(DEVICE_KNOWN_METHODS)
+        self._device_id = None if model is None else f"{model}_{host}"
+        self._transport: asyncio.Transport | None = None
+        self._model_future: asyncio.Future | None = None
+        self._closing = False
+        self._connect_lock = asyncio.Lock()
         self._init_event = asyncio.Event()
+        # Set whenever we are not booting, so waiters wake on any way out.
+        self._boot_done = asyncio.Event()
+        self._boot_done.set()
+        self._power_state = POWER_STATE_OFF
         self._online = False
         self._callback = None
-        self._listener = None
+        self._lost_callback = None
+        self._refreshing: dict[str, asyncio.Event] = {}
+        self._pending: dict[str, list | None] = {}
+        self._refresh_tasks: set[asyncio.Task] = set()
+        self._refresh_re: re.Pattern | None = None
+        self._metrics = SLMetrics()
+        self._sent: dict[str, tuple[str, float]] = {}
+        self._events = SLEventThrottle(hass.loop, self.fire_event, SL_EVENT_INTERVAL)
+        interned: dict[str, int] = {}
+        strings: list[str] = []
+        self._history = {
+            key: SLHistory(SL_HISTORY_SIZE, interned, strings)
+            for key in DEVICE_HISTORY_KEYS
+        }
         self._data = {}
+        self._data[DEVICE_MODEL] = model
         self._data[DEVICE_SOURCES] = []
         self._data[DEVICE_AUDIO_MODES] = []
         self._data[DEVICE_VOICINGS] = []
-        self._response_re = re.compile("^\\!([A-Z0-9]+)(\\(([^)]+)\\)(\"([^\"]+)\")?)?")
+        self._response_re = re.compile(rb'^!([A-Z0-9]+)(\(([^)]+)\)("([^"]+)")?)?')
 
     @property
     def device_id(self) -> str:
@@ -73,11 +207,47 @@ class SLDevice:
         """Return status."""
         return self._online
 
+    @property
+    def initialized(self) -> bool:
+        """Return true once the init handshake is done."""
+        return self._online and self._init_event.is_set()
+
+    @property
+    def power_state(self) -> str:
+        """Return off, booting or ready."""
+        return self._power_state
+
+    @property
+    def metrics(self) -> SLMetrics:
+        """Return protocol metrics."""
+        return self._metrics
+
+    def history(self, key: str) -> SLHistory | None:
+        """Return the transition history for a key."""
+        return self._history.get(key)
+
     @property
     def data(self) -> dict:
         """Return data."""
         return self._data
 
+    @staticmethod
+    def build_sub_re(subscriptions: tuple[str, ...]) -> re.Pattern:
+        """Raw line pattern that passes the notification filter."""
+        methods = {
+            method
+            for sub in (*DEVICE_REQUIRED_SUBS, *subscriptions)
+            for method in (sub, *DEVICE_SUB_ALIASES.get(sub, ()))
+        }
+        methods.update(DEVICE_CATALOG_COUNTS)
+        return SLDevice.build_method_re(methods)
+
+    @staticmethod
+    def build_method_re(methods: Iterable[str]) -> re.Pattern:
+        """Raw line pattern matching any of the methods."""
+        alts = "|".join(re.escape(m) for m in sorted(methods, key=len, reverse=True))
+        return re.compile(f"!(?:{alts})(?:\\(|$)".encode("ascii"))
+
     def get_data_value(self, name: str):
         """Return the named data."""
         return self._data.get(name)
@@ -86,31 +256,46 @@ class SLDevice:
         """Establish a connection."""
         if self.online:
             return True
-
+        # Lines can trigger sends before the handshake below has finished.
+        async with self._connect_lock:
+            if self.online:
+                return True
+            return await self._open_connection(test)
+
+    async def _open_connection(self, test: bool) -> bool:
+        """Connect and read the model."""
+        loop = asyncio.get_running_loop()
         try:
             _LOGGER.debug("Establish new connection")
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self._host, SL_PORT),
+            future = self._model_future = loop.create_future()
+            self._transport, _ = await asyncio.wait_for(
+                loop.create_connection(
+                    lambda: SLProtocol(
+                        self.on_line, self.on_connection_lost, self.on_overflow
+                    ),
+                    self._host,
+                    self._port,
+                ),
                 timeout=SL_CONNECT_TIMEOUT,
             )
-            self._writer.write(b"!DEVICE?\r")
-            devresp = await asyncio.wait_for(
-                self._reader.readuntil(b'\r'), timeout=SL_LOGIN_TIMEOUT
-            )
-            resp = self.decode_response(devresp)
+            self._transport.write(b"!DEVICE?\r")
+            resp = await asyncio.wait_for(future, timeout=SL_LOGIN_TIMEOUT)
             if resp is None:
+                self.close_transport()
                 return False
             model = self._data[DEVICE_MODEL] = resp["data"]
             self._device_id = f"{model}_{self._host}"
             if test:
-                self._writer.close()
+                self.close_transport()
             else:
+                self._metrics.connects += 1
                 self._online = True
-                self._listener = asyncio.create_task(self.listener())
 
-        except (TimeoutError, OSError, asyncio.IncompleteReadError) as err:
+        except (TimeoutError, OSError) as err:
+            self.close_transport()
             self._online = False
-            _LOGGER.error("Connect sequence error %s", err)
+            # Callers report the ConnectionError, avoid an error per retry.
+            _LOGGER.debug("Connect sequence error %s", err)
             raise ConnectionError("Connect sequence error") from err
 
         return True
@@ -119,7 +304,8 @@ class SLDevice:
         """Make an API call."""
         if await self.open_connection():
              _LOGGER.debug("-> %s", reqstr)
-             self._writer.write(reqstr.encode("ascii"))
+             self._transport.write(reqstr.encode("ascii"))
+             self._metrics.lines_out += 1
 
     async def send_query(self, method: str) -> None:
         """Format and send command."""
@@ -128,17 +314,139 @@ class SLDevice:
 
     async def send_command(self, method: str, data=None) -> None:
         """Format and send command."""
+        if method in DEVICE_READY_METHODS:
+            await self.wait_ready()
         reqstr = f"!{method}\r" if data is None else f"!{method}({data})\r"
         await self.send_to_device(reqstr)
-
-    def decode_response(self, resp: str) -> dict:
+        key, value = DEVICE_COMMAND_ECHOES.get(method, (method, str(data)))
+        self._sent[key] = (value, time.monotonic())
+
+    def event_origin(self, key: str, value: str) -> str:
+        """Self if the change matches a command we sent recently."""
+        sent = self._sent.get(key)
+        if (
+            sent is not None
+            and sent[0] == value
+            and time.monotonic() - sent[1] < SL_EVENT_ORIGIN_WINDOW
+        ):
+            return EVENT_ORIGIN_SELF
+        return EVENT_ORIGIN_EXTERNAL
+
+    @callback
+    def fire_event(self, key: str, old: str | None, new: str, origin: str) -> None:
+        """Put a change on the HA event bus."""
+        self._hass.bus.async_fire(
+            SL_EVENT,
+            {
+                "device_id": self._device_id,
+                "key": key,
+                "old": old,
+                "new": new,
+                "origin": origin,
+            },
+        )
+
+    async def wait_ready(self) -> None:
+        """Hold the caller while the processor is booting."""
+        if self._power_state != POWER_STATE_BOOTING:
+            return
+        try:
+            await asyncio.wait_for(self._boot_done.wait(), timeout=SL_BOOT_TIMEOUT)
+        except TimeoutError:
+            _LOGGER.warning("Device not ready after %ss, sending anyway", SL_BOOT_TIMEOUT)
+            return
+        if self._power_state != POWER_STATE_READY:
+            _LOGGER.debug("Boot ended in %s, sending anyway", self._power_state)
+
+    def set_power_state(self, state: str) -> None:
+        """Move the power state machine."""
+        if state == self._power_state:
+            return
+        _LOGGER.debug("power state %s -> %s", self._power_state, state)
+        self._power_state = state
+        if state == POWER_STATE_BOOTING:
+            self._boot_done.clear()
+        else:
+            self._boot_done.set()
+
+    def decode_response(self, line: memoryview) -> dict:
         """Decode the response."""
-        respstr = resp.decode("ascii")
-        _LOGGER.debug("<- %s", respstr)
-        m = self._response_re.match(respstr)
+        metrics = self._metrics
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("<- %s", line.tobytes().decode("ascii", "replace"))
+        m = self._response_re.match(line)
         if m is None:
+            metrics.parse_failures += 1
             return None
-        return {"method": m.group(1), "data": m.group(3), "extra": m.group(5) }
+        method, data, extra = m.group(1, 3, 5)
+        return {
+            "method": method.decode("ascii"),
+            "data": None if data is None else data.decode("ascii", "replace"),
+            "extra": None if extra is None else extra.decode("ascii", "replace"),
+        }
+
+    def on_line(self, line: memoryview) -> None:
+        """Route a framed line from the transport."""
+        self._metrics.lines_in += 1
+        self._metrics.last_line = time.monotonic()
+        future = self._model_future
+        if future is not None:
+            self._model_future = None
+            if not future.done():
+                future.set_result(self.decode_response(line))
+            return
+        try:
+            self.listener(line)
+        except Exception:
+            self._metrics.listener_errors += 1
+            _LOGGER.exception("Error handling %r", line.tobytes())
+
+    def on_overflow(self, size: int) -> None:
+        """Transport dropped an overlong line."""
+        self._metrics.oversized_lines += 1
+        _LOGGER.warning("Dropped %d bytes without line end", size)
+
+    def on_connection_lost(self, exc: Exception | None) -> None:
+        """Transport went away."""
+        expected = self._closing
+        if expected:
+            _LOGGER.debug("Connection closed")
+        elif exc is None:
+            _LOGGER.error("Connection closed by device")
+        else:
+            _LOGGER.error("Connection lost %s", exc)
+        self._closing = False
+        self._online = False
+        self._transport = None
+        # Unknown until the device reports again, release held commands.
+        self.set_power_state(POWER_STATE_OFF)
+        future = self._model_future
+        if future is not None and not future.done():
+            future.set_exception(ConnectionError("Connection closed"))
+        if not expected:
+            # The handshake has to run again on the next connection.
+            self._init_event.clear()
+        # Let entities pick up the availability change.
+        if self._callback is not None:
+            self._callback(self._data)
+        if not expected and self._lost_callback is not None:
+            self._lost_callback()
+
+    def close(self) -> None:
+        """Drop the connection and held events."""
+        # The coordinator is gone after unload, never call back into it.
+        self._callback = None
+        self._lost_callback = None
+        self._events.cancel()
+        for task in self._refresh_tasks:
+            task.cancel()
+        self.close_transport()
+
+    def close_transport(self) -> None:
+        """Close the connection on purpose."""
+        if self._transport is not None:
+            self._closing = True
+            self._transport.close()
 
     async def test_connection(self) -> bool:
         """Test a connect."""
@@ -149,8 +457,11 @@ class SLDevice:
         # return await self.send_command("environment.getcontrolblocks",{"type": "Sensor", "valuetype": "Temperature"})
         return True
 
-    async def async_init(self, data_callback: callback) -> dict:
+    async def async_init(
+        self, data_callback: callback, lost_callback: Callable[[], None] | None = None
+    ) -> dict:
         """Query position and wait for response."""
+        self._lost_callback = lost_callback
         await self.send_query(DEVICE_SOURCES)
         await self.send_query(DEVICE_AUDIO_MODES)
         await self.send_query(DEVICE_VOICINGS)
@@ -158,53 +469,170 @@ class SLDevice:
         await asyncio.wait_for(self._init_event.wait(), timeout=SL_LOGIN_TIMEOUT)
 
         self._callback = data_callback
-        for sub in DEVICE_SUBS:
+        for sub in (*DEVICE_REQUIRED_SUBS, *self._subscriptions):
             await self.send_query(sub)
-        await self.send_command("VERB", "1")
+        await self.send_command("VERB", str(self._verbosity))
         return self._data
 
-    async def listener(self) -> None:
-        """Listen for status updates from device."""
-
-        while True:
-            buf = await self._reader.readuntil(b'\r')
-            if len(buf) == 0:
-                _LOGGER.error("Connection closed")
-                break
-            resp = self.decode_response(buf)
-            if resp is None:
-                continue
-
-            method = resp.get("method")
-            data = resp.get("data")
-            if method is not None:
-                if method in [DEVICE_MUTEOFF, DEVICE_MUTEON]:
-                    data = method
-                    method = DEVICE_MUTE
-                if not self._init_event.is_set():
-                    if method == DEVICE_SOURCE:
-                        self._data[DEVICE_SOURCES][int(data)] = resp.get("extra")
-                    elif method == DEVICE_SOURCE_COUNT:
-                        self._data[DEVICE_SOURCES] = [None for i in range(int(data))]
-                    elif method == DEVICE_AUDIO_MODE:
-                        self._data[DEVICE_AUDIO_MODES][int(data)] = resp.get("extra")
-                    elif method == DEVICE_AUDIO_MODE_COUNT:
-                        self._data[DEVICE_AUDIO_MODES] = [None for i in range(int(data))]
-                    elif method == DEVICE_VOICING:
-                        self._data[DEVICE_VOICINGS][int(data)] = resp.get("extra")
-                    elif method == DEVICE_VOICING_COUNT:
-                        self._data[DEVICE_VOICINGS] = [None for i in range(int(data))]
-                    elif method == DEVICE_MUTE:
-                        self._data[method] = data
-                        self._init_event.set()
-                        _LOGGER.debug("init sequence complete")
-                else:
+    def listener(self, line: memoryview) -> None:
+        """Handle one status line from the device."""
+
+        if (
+            self._init_event.is_set()
+            and self._sub_re.match(line) is None
+            and (self._refresh_re is None or self._refresh_re.match(line) is None)
+        ):
+            # Classify without decoding, filtered_lines only counts known keys.
+            if self._known_re.match(line) is not None:
+                self._metrics.filtered_lines += 1
+            elif self._response_re.match(line) is not None:
+                self._metrics.unknown_methods += 1
+            else:
+                self._metrics.parse_failures += 1
+            return
+        start = time.perf_counter()
+        resp = self.decode_response(line)
+        if resp is None:
+            return
+
+        method = resp.get("method")
+        data = resp.get("data")
+        if method is not None:
+            if method in DEVICE_KNOWN_METHODS:
+                self._metrics.methods[method] += 1
+            else:
+                self._metrics.unknown_methods += 1
+            if method in [DEVICE_MUTEOFF, DEVICE_MUTEON]:
+                data = method
+                method = DEVICE_MUTE
+            elif method == DEVICE_POWER:
+                self.set_power_state(
+                    POWER_STATE_READY if data == "1" else POWER_STATE_OFF
+                )
+            elif method in DEVICE_CATALOGS:
+                # Catalog lists live under these keys, never overwrite them.
+                return
+            extra = resp.get("extra")
+            catalog = DEVICE_CATALOG_ENTRIES.get(method)
+            if method in DEVICE_CATALOG_COUNTS:
+                count = parse_int(data)
+                if count is not None and 0 <= count <= DEVICE_MAX_CATALOG:
+                    self.update_catalog_count(DEVICE_CATALOG_COUNTS[method], count)
+            elif not self._init_event.is_set():
+                if catalog is not None:
+                    entries = self._data[catalog]
+                    index = parse_int(data)
+                    if index is not None and 0 <= index < len(entries):
+                        entries[index] = extra
+                elif method == DEVICE_MUTE:
                     self._data[method] = data
-                if self._callback is not None:
-                    self._callback(self._data)
-
-        self._writer.close()
-        self._online = False
+                    self._init_event.set()
+                    _LOGGER.debug("init sequence complete")
+            elif catalog in self._refreshing and extra is not None:
+                # Plain current-value notifications fall through below.
+                self.update_catalog_entry(catalog, parse_int(data), extra)
+            else:
+                if catalog is not None and extra is not None:
+                    self.check_catalog_entry(catalog, parse_int(data), extra)
+                if method in DEVICE_EVENT_KEYS and data is not None:
+                    old = self._data.get(method)
+                    if old is not None and old != data:
+                        self._events.push(
+                            method, old, data, self.event_origin(method, data)
+                        )
+                self._data[method] = data
+                history = self._history.get(method)
+                if history is not None:
+                    # Catalog-backed keys record the name, indexes move on refresh.
+                    if catalog is not None:
+                        value = extra or self.catalog_value(catalog, method)
+                    else:
+                        value = data
+                    if value is not None:
+                        history.record(value)
+            if self._callback is not None:
+                self._callback(self._data)
+                # From line in to update queued, entity work is in dispatch_latency.
+                self._metrics.listener_latency.record(time.perf_counter() - start)
+
+    def update_catalog_count(self, catalog: str, count: int) -> None:
+        """Handle a catalog size report."""
+        if not self._init_event.is_set():
+            self._data[catalog] = [None for i in range(count)]
+        elif catalog in self._refreshing:
+            self._pending[catalog] = [None for i in range(count)]
+            if count == 0:
+                self.update_catalog_entry(catalog, None, None)
+        elif count != len(self._data[catalog]):
+            self.refresh_catalog(catalog)
+
+    def check_catalog_entry(self, catalog: str, index: int | None, name: str) -> None:
+        """Refresh the catalog if a name no longer matches."""
+        entries = self._data[catalog]
+        if index is None or index < 0:
+            return
+        if index >= len(entries) or entries[index] != name:
+            self.refresh_catalog(catalog)
+
+    def update_catalog_entry(
+        self, catalog: str, index: int | None, name: str | None
+    ) -> None:
+        """Fill a catalog being refreshed, publish it once complete."""
+        pending = self._pending.get(catalog)
+        if pending is None:
+            return
+        if name is not None and index is not None and 0 <= index < len(pending):
+            pending[index] = name
+        if None not in pending:
+            _LOGGER.debug("catalog %s refreshed", catalog)
+            self._data[catalog] = pending
+            self._pending[catalog] = None
+            self._refreshing[catalog].set()
+
+    def refresh_catalog(self, catalog: str) -> None:
+        """Start re-fetching one catalog."""
+        if catalog in self._refreshing:
+            return
+        _LOGGER.debug("catalog %s changed, refreshing", catalog)
+        self._refreshing[catalog] = asyncio.Event()
+        self._pending[catalog] = None
+        self.update_refresh_re()
+        task = self._hass.async_create_task(self.async_refresh_catalog(catalog))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    def update_refresh_re(self) -> None:
+        """Let entries of refreshing catalogs through the filter."""
+        self._refresh_re = (
+            self.build_method_re(DEVICE_CATALOGS[c][1] for c in self._refreshing)
+            if self._refreshing
+            else None
+        )
+
+    async def async_refresh_catalog(self, catalog: str) -> None:
+        """Query one catalog and wait for it to complete."""
+        try:
+            try:
+                await self.send_query(catalog)
+                await asyncio.wait_for(
+                    self._refreshing[catalog].wait(), timeout=SL_LOGIN_TIMEOUT
+                )
+            finally:
+                del self._refreshing[catalog]
+                del self._pending[catalog]
+                self.update_refresh_re()
+            # Entries of a refreshing catalog are not applied as current values.
+            await self.send_query(DEVICE_CATALOGS[catalog][1])
+        except (TimeoutError, ConnectionError):
+            _LOGGER.warning("Catalog %s refresh failed", catalog)
+
+    def catalog_value(self, catalog: str, key: str) -> str | None:
+        """Look up the current value of key in its catalog."""
+        entries = self._data[catalog]
+        index = parse_int(self._data.get(key))
+        if index is None or not 0 <= index < len(entries):
+            return None
+        return entries[index]
 
     @property
     def is_on(self) -> bool:
@@ -219,10 +647,7 @@ class SLDevice:
     @property
     def source(self) -> str:
         """Current source."""
-        src = self._data.get(DEVICE_SOURCE)
-        if src is None:
-            return None
-        return self._data[DEVICE_SOURCES][int(src)]
+        return self.catalog_value(DEVICE_SOURCES, DEVICE_SOURCE)
 
     async def async_select_source(self, source: str):
         """Change source."""
@@ -230,19 +655,22 @@ class SLDevice:
 
     async def async_turn_on(self):
         """Device turn on."""
-        await self.send_command("POWERONMAIN", None)
+        await self.send_command(DEVICE_POWER_ON, None)
+        # Only after the write went out, a failed send must not leave us booting.
+        if self._power_state == POWER_STATE_OFF:
+            self.set_power_state(POWER_STATE_BOOTING)
 
     async def async_turn_off(self):
         """Device turn off."""
-        await self.send_command("POWEROFFMAIN", None)
+        await self.send_command(DEVICE_POWER_OFF, None)
 
     @property
     def volume_level(self) -> float | None:
         """Current volume."""
-        devvol = self._data.get(DEVICE_VOL)
+        devvol = parse_int(self._data.get(DEVICE_VOL))
         if devvol is None:
             return None
-        return (int(devvol) + DEVICE_VOL_RANGE) / DEVICE_VOL_RANGE
+        return (devvol + DEVICE_VOL_RANGE) / DEVICE_VOL_RANGE
 
     @property
     def is_volume_muted(self) -> bool:
@@ -250,9 +678,9 @@ class SLDevice:
         return self._data.get(DEVICE_MUTE) == DEVICE_MUTEON
 
     @property
-    def lipsync(self) -> int:
+    def lipsync(self) -> int | None:
         """Current lipsync."""
-        return int(self._data.get(DEVICE_LIPSYNC))
+        return parse_int(self._data.get(DEVICE_LIPSYNC))
 
     async def async_set_lipsync(self, lipsync: int):
         """Set lipsync."""
@@ -286,10 +714,7 @@ class SLDevice:
     @property
     def sound_mode(self) -> str:
         """Current source."""
-        mode = self._data.get(DEVICE_VOICING)
-        if mode is None:
-            return None
-        return self._data[DEVICE_VOICINGS][int(mode)]
+        return self.catalog_value(DEVICE_VOICINGS, DEVICE_VOICING)
 
     async def async_select_sound_mode(self, mode: str):
         """Change source."""
@@ -303,10 +728,7 @@ class SLDevice:
     @property
     def audio_processing_mode(self) -> str:
         """Current source."""
-        mode = self._data.get(DEVICE_AUDIO_MODE)
-        if mode is None:
-            return None
-        return self._data[DEVICE_AUDIO_MODES][int(mode)]
+        return self.catalog_value(DEVICE_AUDIO_MODES, DEVICE_AUDIO_MODE)
 
     async def async_select_audio_processing_mode(self, mode: str):
         """Change source."""
@@ -0,0 +1,32 @@
+"""Diagnostics support for SL."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .coordinator import SLConfigEntry
+from .device import DEVICE_HISTORY_KEYS
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: SLConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    device = entry.runtime_data.device
+
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "online": device.online,
+        "power_state": device.power_state,
+        "data": device.data,
+        "metrics": device.metrics.as_dict(),
+        "history": {
+            key: device.history(key).stats() for key in DEVICE_HISTORY_KEYS
+        },
+    }
@@ -1,12 +1,15 @@
 """SL Entity Base class."""
 
+from datetime import datetime, timedelta
 import logging
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SL_MANUFACTURER
+from .const import DOMAIN, SL_MANUFACTURER, SL_STATS_INTERVAL
 from .coordinator import SLCoordinator
 from .device import DEVICE_MODEL, SLDevice
 
@@ -17,6 +20,8 @@ class SLEntity(CoordinatorEntity[SLCoordinator]):
     """Base class."""
 
     _attr_has_entity_name = True
+    # History statistics move with time, keep them out of the recorder.
+    _unrecorded_attributes = frozenset({"time_in", "switches", "switches_per_hour"})
 
     def __init__(self, coordinator: SLCoordinator, desc: EntityDescription) -> None:
         """Set up entity."""
@@ -36,6 +41,34 @@ class SLEntity(CoordinatorEntity[SLCoordinator]):
 
     #        _LOGGER.error(f"new entity={entity} name={self._attr_name} unique_id={self.unique_id}")
 
+    @property
+    def history_key(self) -> str | None:
+        """Device key whose history statistics become attributes."""
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        """Start sampling history statistics."""
+        await super().async_added_to_hass()
+        if self.history_key is None:
+            return
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_sample_stats,
+                timedelta(seconds=SL_STATS_INTERVAL),
+            )
+        )
+        self._async_sample_stats()
+
+    @callback
+    def _async_sample_stats(self, now: datetime | None = None) -> None:
+        """Refresh the statistics attributes, only on the timer."""
+        history = self.coordinator.device.history(self.history_key)
+        self._attr_extra_state_attributes = (
+            history.stats() if history is not None and history.count else None
+        )
+        self.async_write_ha_state()
+
     @property
     def entity_type(self) -> str | None:
         """Type of entity."""
@@ -49,7 +82,7 @@ class SLEntity(CoordinatorEntity[SLCoordinator]):
     @property
     def available(self) -> bool:
         """Return online state."""
-        return self.coordinator.device.online
+        return self.coordinator.device.initialized
 
     @property
     def device(self) -> SLDevice:
@@ -0,0 +1,53 @@
+"""Rate-limited device events."""
+
+import asyncio
+from collections.abc import Callable
+
+
+class SLEventThrottle:
+    """Per-key rate limit that coalesces bursts into one event."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        fire: Callable[[str, str | None, str, str], None],
+        interval: float,
+    ) -> None:
+        """Set up throttle."""
+        self._loop = loop
+        self._fire = fire
+        self._interval = interval
+        self._last: dict[str, float] = {}
+        self._pending: dict[str, list] = {}
+        self._handles: dict[str, asyncio.TimerHandle] = {}
+
+    def push(self, key: str, old: str | None, new: str, origin: str) -> None:
+        """Fire now, or fold into the event held for this key."""
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending[1] = new
+            pending[2] = origin
+            return
+        now = self._loop.time()
+        last = self._last.get(key)
+        if last is None or now - last >= self._interval:
+            self._last[key] = now
+            self._fire(key, old, new, origin)
+            return
+        self._pending[key] = [old, new, origin]
+        self._handles[key] = self._loop.call_at(last + self._interval, self._flush, key)
+
+    def _flush(self, key: str) -> None:
+        """Fire the coalesced event."""
+        del self._handles[key]
+        old, new, origin = self._pending.pop(key)
+        self._last[key] = self._loop.time()
+        if old != new:
+            self._fire(key, old, new, origin)
+
+    def cancel(self) -> None:
+        """Drop held events."""
+        for handle in self._handles.values():
+            handle.cancel()
+        self._handles.clear()
+        self._pending.clear()
@@ -0,0 +1,61 @@
+"""Compact signal format history for the SL device."""
+
+from array import array
+import time
+
+SL_HISTORY_MAX_CODE = 0xFFFF
+
+
+class SLHistory:
+    """Fixed-size ring of (timestamp, code) transitions for one key."""
+
+    __slots__ = ("_codes", "_interned", "_next", "_size", "_stamps", "_strings", "count")
+
+    def __init__(self, size: int, interned: dict[str, int], strings: list[str]) -> None:
+        """Allocate the ring, the intern table is shared between keys."""
+        self._size = size
+        self._stamps = array("d", bytes(8 * size))
+        self._codes = array("H", bytes(2 * size))
+        self._interned = interned
+        self._strings = strings
+        self._next = 0
+        self.count = 0
+
+    def record(self, value: str, stamp: float | None = None) -> None:
+        """Add a transition unless the value is unchanged."""
+        code = self._interned.get(value)
+        if code is None:
+            if len(self._strings) > SL_HISTORY_MAX_CODE:
+                return
+            code = self._interned[value] = len(self._strings)
+            self._strings.append(value)
+        if self.count and self._codes[self._next - 1] == code:
+            return
+        self._stamps[self._next] = time.monotonic() if stamp is None else stamp
+        self._codes[self._next] = code
+        self._next = (self._next + 1) % self._size
+        self.count = min(self.count + 1, self._size)
+
+    def entries(self) -> list[tuple[float, str]]:
+        """Return transitions, oldest first."""
+        start = (self._next - self.count) % self._size
+        return [
+            (self._stamps[i % self._size], self._strings[self._codes[i % self._size]])
+            for i in range(start, start + self.count)
+        ]
+
+    def stats(self, now: float | None = None) -> dict:
+        """Time in each value, switch count and switch rate over the ring."""
+        if now is None:
+            now = time.monotonic()
+        entries = self.entries()
+        time_in: dict[str, float] = {}
+        for (stamp, value), (end, _) in zip(entries, [*entries[1:], (now, None)]):
+            time_in[value] = time_in.get(value, 0.0) + end - stamp
+        switches = max(len(entries) - 1, 0)
+        window = now - entries[0][0] if entries else 0.0
+        return {
+            "time_in": {value: round(secs) for value, secs in time_in.items()},
+            "switches": switches,
+            "switches_per_hour": round(switches * 3600 / window, 2) if window else None,
+        }
@@ -14,6 +14,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import SLConfigEntry, SLCoordinator
+from .device import DEVICE_SOURCE
 from .entity import SLEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -56,7 +57,12 @@ class SLMediaPlayer(MediaPlayerEntity, SLEntity):
     @property
     def available(self) -> bool:
         """Is device online."""
-        return self.coordinator.device.online
+        return self.coordinator.device.initialized
+
+    @property
+    def history_key(self) -> str:
+        """Source history."""
+        return DEVICE_SOURCE
 
     @property
     def is_on(self) -> bool:
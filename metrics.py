@@ -0,0 +1,108 @@
+"""Protocol instrumentation for the SL device."""
+
+from bisect import bisect_left
+from collections import Counter
+import time
+
+# Upper bucket bounds in milliseconds, the last bucket catches everything else.
+LATENCY_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 100.0)
+
+
+class SLHistogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        """Set up buckets."""
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed: float) -> None:
+        """Add one sample, elapsed in seconds."""
+        ms = elapsed * 1000.0
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def as_dict(self) -> dict:
+        """Return a serializable view."""
+        buckets = {f"le_{b}": c for b, c in zip(LATENCY_BUCKETS_MS, self.counts)}
+        buckets["inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 4) if self.count else None,
+            "max_ms": round(self.max, 4),
+            "buckets": buckets,
+        }
+
+
+class SLMetrics:
+    """Always-on counters for the protocol hot path."""
+
+    __slots__ = (
+        "lines_in",
+        "lines_out",
+        "parse_failures",
+        "unknown_methods",
+        "filtered_lines",
+        "oversized_lines",
+        "listener_errors",
+        "methods",
+        "listener_latency",
+        "dispatch_latency",
+        "connects",
+        "last_line",
+        "init_time",
+    )
+
+    def __init__(self) -> None:
+        """Zero everything."""
+        self.lines_in = 0
+        self.lines_out = 0
+        self.parse_failures = 0
+        self.unknown_methods = 0
+        self.filtered_lines = 0
+        self.oversized_lines = 0
+        self.listener_errors = 0
+        self.methods = Counter()
+        self.listener_latency = SLHistogram()
+        self.dispatch_latency = SLHistogram()
+        self.connects = 0
+        self.last_line = None
+        self.init_time = None
+
+    @property
+    def reconnects(self) -> int:
+        """Connections made after the first one."""
+        return max(self.connects - 1, 0)
+
+    @property
+    def since_last_line(self) -> float | None:
+        """Seconds since the last line arrived."""
+        if self.last_line is None:
+            return None
+        return time.monotonic() - self.last_line
+
+    def as_dict(self) -> dict:
+        """Return a serializable view."""
+        since = self.since_last_line
+        return {
+            "lines_in": self.lines_in,
+            "lines_out": self.lines_out,
+            "parse_failures": self.parse_failures,
+            "unknown_methods": self.unknown_methods,
+            "filtered_lines": self.filtered_lines,
+            "oversized_lines": self.oversized_lines,
+            "listener_errors": self.listener_errors,
+            "methods": dict(self.methods),
+            "listener_latency": self.listener_latency.as_dict(),
+            "dispatch_latency": self.dispatch_latency.as_dict(),
+            "reconnects": self.reconnects,
+            "init_time": None if self.init_time is None else round(self.init_time, 3),
+            "since_last_line": None if since is None else round(since, 3),
+        }
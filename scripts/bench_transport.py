@@ -0,0 +1,107 @@
+"""Benchmark SLProtocol framing against the old StreamReader.readuntil loop.
+
+A loopback server streams notification lines, each client frames and
+decodes them the way SLDevice does. Runs without Home Assistant:
+
+    python scripts/bench_transport.py [lines] [rounds]
+"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+import re
+import sys
+import time
+
+_spec = importlib.util.spec_from_file_location(
+    "sl_transport", Path(__file__).resolve().parents[1] / "transport.py"
+)
+transport = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(transport)
+
+# Same patterns as SLDevice, before and after the transport change.
+STR_RE = re.compile("^\\!([A-Z0-9]+)(\\(([^)]+)\\)(\"([^\"]+)\")?)?")
+BYTES_RE = re.compile(rb'^!([A-Z0-9]+)(\(([^)]+)\)("([^"]+)")?)?')
+
+LINES = (
+    b"!VOL(-300)\r",
+    b'!AUDTYPE(3)"Dolby Atmos"\r',
+    b"!MUTEON\r",
+    b"!SRC(2)\r",
+)
+
+
+async def read_streamreader(port: int) -> int:
+    """Baseline: one readuntil, bytes and str per line."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    count = 0
+    try:
+        while True:
+            buf = await reader.readuntil(b"\r")
+            m = STR_RE.match(buf.decode("ascii"))
+            if m is not None:
+                m.group(1, 3, 5)
+                count += 1
+    except asyncio.IncompleteReadError:
+        pass
+    writer.close()
+    return count
+
+
+async def read_protocol(port: int) -> int:
+    """SLProtocol: views into one buffer, bytes regex on the view."""
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+    count = 0
+
+    def on_line(line: memoryview) -> None:
+        nonlocal count
+        m = BYTES_RE.match(line)
+        if m is not None:
+            m.group(1, 3, 5)
+            count += 1
+
+    await loop.create_connection(
+        lambda: transport.SLProtocol(
+            on_line, lambda exc: done.set_result(None), lambda size: None
+        ),
+        "127.0.0.1",
+        port,
+    )
+    await done
+    return count
+
+
+async def main(lines: int, rounds: int) -> None:
+    """Run both readers against the same payload."""
+    payload = b"".join(LINES[i % len(LINES)] for i in range(lines))
+
+    async def serve(reader, writer):
+        writer.write(payload)
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    for _ in range(rounds):
+        for name, reader in (
+            ("streamreader", read_streamreader),
+            ("protocol", read_protocol),
+        ):
+            start = time.perf_counter()
+            count = await reader(port)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name:13s} {count} lines {elapsed:.3f}s "
+                f"{count / elapsed / 1000:.0f}k lines/s"
+            )
+    server.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 500_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 2,
+        )
+    )
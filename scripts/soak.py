@@ -0,0 +1,139 @@
+"""Fuzz and soak the SLDevice listener against a loopback stand-in.
+
+The stand-in answers the DEVICE handshake and the init catalogs, then streams
+randomized, truncated, binary, oversized and interleaved protocol lines at
+full rate, splitting writes at random points. Every interval the driver
+asserts the connection is still up and metrics.listener_errors is zero, and
+reports lines/s and tracemalloc growth. Needs Home Assistant installed:
+
+    python scripts/soak.py [seconds] [interval] [seed]
+"""
+
+import asyncio
+import importlib
+import logging
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from homeassistant.core import HomeAssistant
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT.parent))
+device = importlib.import_module(f"{ROOT.name}.device")
+transport = importlib.import_module(f"{ROOT.name}.transport")
+
+METHODS = (
+    *device.DEVICE_KNOWN_METHODS,
+    device.DEVICE_SOURCES,
+    "XYZ",
+    "SRCX",
+    "",
+)
+ARGS = ("0", "1", "2", "5", "-300", "99999999", "abc", "", "\xe9", "1)(2")
+NAMES = ("Apple TV", "PCM", "Dolby Atmos", "HDR10", "", 'a"b')
+
+
+def init_lines() -> bytes:
+    """Catalog answers for the init handshake."""
+    return (
+        b'!SRCCOUNT(3)\r!SRC(0)"Apple TV"\r!SRC(1)"Blu-ray"\r!SRC(2)"Tuner"\r'
+        b'!AUDMODECOUNT(2)\r!AUDMODE(0)"Bypass"\r!AUDMODE(1)"Upmix"\r'
+        b"!RPVOICOUNT(0)\r!MUTEOFF\r!POWER(1)\r"
+    )
+
+
+def random_line(rng: random.Random) -> bytes:
+    """One protocol line, valid, truncated, binary or oversized."""
+    roll = rng.random()
+    if roll < 0.02:
+        return bytes(rng.getrandbits(8) for _ in range(rng.randint(1, 80))) + b"\r"
+    if roll < 0.025:
+        return b"!VOL(" + b"9" * rng.randint(4000, 20000) + b")\r"
+    line = f"!{rng.choice(METHODS)}({rng.choice(ARGS)})"
+    if rng.random() < 0.3:
+        line += f'"{rng.choice(NAMES)}"'
+    raw = line.encode("latin-1")
+    if roll < 0.08:
+        raw = raw[: rng.randint(0, len(raw))]
+    return raw + b"\r"
+
+
+async def serve(reader, writer, rng: random.Random) -> None:
+    """Loopback stand-in for the processor."""
+    await reader.readuntil(b"\r")
+    writer.write(b"!DEVICE(SOAK)\r")
+    writer.write(init_lines())
+    try:
+        while True:
+            chunk = b"".join(random_line(rng) for _ in range(256))
+            if rng.random() < 0.2:
+                # Catalog refresh interleaved with notifications.
+                chunk += b"!SRCCOUNT(4)\r!VOL(-200)\r" + init_lines()
+            while chunk:
+                cut = rng.randint(1, len(chunk))
+                writer.write(chunk[:cut])
+                chunk = chunk[cut:]
+            await writer.drain()
+            await asyncio.sleep(0)
+    except ConnectionError:
+        pass
+
+
+async def main(seconds: float, interval: float, seed: int) -> None:
+    """Run the soak and fail loudly if the listener dies."""
+    logging.basicConfig(level=logging.ERROR)
+    rng = random.Random(seed)
+    server = await asyncio.start_server(
+        lambda r, w: serve(r, w, rng), "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        dev = device.SLDevice(hass, "127.0.0.1", port=port)
+        await dev.async_init(lambda data: None)
+        assert isinstance(dev._transport.get_protocol(), transport.SLProtocol)
+
+        tracemalloc.start()
+        base, _ = tracemalloc.get_traced_memory()
+        metrics = dev.metrics
+        start = last_time = time.monotonic()
+        last_lines = metrics.lines_in
+        while (now := time.monotonic()) - start < seconds:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            assert dev.online, "listener connection died"
+            assert metrics.listener_errors == 0, "listener raised"
+            current, peak = tracemalloc.get_traced_memory()
+            rate = (metrics.lines_in - last_lines) / (now - last_time)
+            print(
+                f"t={now - start:8.0f}s lines={metrics.lines_in} "
+                f"rate={rate / 1000:.1f}k/s mem={current / 1024:.0f}KiB "
+                f"growth={(current - base) / 1024:+.0f}KiB peak={peak / 1024:.0f}KiB "
+                f"parse_failures={metrics.parse_failures} "
+                f"unknown={metrics.unknown_methods} "
+                f"oversized={metrics.oversized_lines}",
+                flush=True,
+            )
+            last_lines, last_time = metrics.lines_in, now
+
+        dev.close()
+        # Let the stand-in see the close before the loop shuts down.
+        await asyncio.sleep(0.1)
+    server.close()
+    await server.wait_closed()
+    print("ok: listener survived", metrics.lines_in, "lines")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            float(sys.argv[1]) if len(sys.argv) > 1 else 3600,
+            float(sys.argv[2]) if len(sys.argv) > 2 else 10,
+            int(sys.argv[3]) if len(sys.argv) > 3 else 0,
+        )
+    )
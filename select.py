@@ -7,6 +7,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import SLConfigEntry, SLCoordinator
+from .device import DEVICE_AUDIO_MODE
 from .entity import SLEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,8 +39,14 @@ class SLSelect(SelectEntity, SLEntity):
         self._attr_options = self.coordinator.device.audio_processing_mode_list
         self._local_current_option = self.coordinator.device.audio_processing_mode
 
+    @property
+    def history_key(self) -> str:
+        """Audio mode history."""
+        return DEVICE_AUDIO_MODE
+
     def set_state(self) -> None:
         """Set how things are."""
+        self._attr_options = self.coordinator.device.audio_processing_mode_list
         self._local_current_option = self.coordinator.device.audio_processing_mode
 
     @property
@@ -1,15 +1,20 @@
 """Platform for sensor integration."""
 
+from datetime import datetime, timedelta
 import logging
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 
+from .const import SL_METRICS_INTERVAL
 from .coordinator import SLConfigEntry
 from .device import DEVICE_AUDIO_TYPE, DEVICE_VIDEO_TYPE
 from .entity import SLEntity
@@ -24,6 +29,14 @@ SENSOR_MAP = {
     SENSOR_VIDEO_TYPE: DEVICE_VIDEO_TYPE
 }
 
+SENSOR_LINES_IN = "lines_in"
+SENSOR_LINES_OUT = "lines_out"
+SENSOR_PARSE_FAILURES = "parse_failures"
+SENSOR_UNKNOWN_METHODS = "unknown_methods"
+SENSOR_FILTERED_LINES = "filtered_lines"
+SENSOR_RECONNECTS = "reconnects"
+SENSOR_SINCE_LAST_LINE = "since_last_line"
+
 SENSOR_DESCRIPTIONS = (
     SensorEntityDescription(
         key=SENSOR_AUDIO_TYPE,
@@ -37,6 +50,35 @@ SENSOR_DESCRIPTIONS = (
     ),
 )
 
+METRIC_SENSOR_DESCRIPTIONS = (
+    *(
+        SensorEntityDescription(
+            key=key,
+            translation_key=key,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+        )
+        for key in (
+            SENSOR_LINES_IN,
+            SENSOR_LINES_OUT,
+            SENSOR_PARSE_FAILURES,
+            SENSOR_UNKNOWN_METHODS,
+            SENSOR_FILTERED_LINES,
+            SENSOR_RECONNECTS,
+        )
+    ),
+    SensorEntityDescription(
+        key=SENSOR_SINCE_LAST_LINE,
+        translation_key=SENSOR_SINCE_LAST_LINE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=0,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -46,6 +88,9 @@ async def async_setup_entry(
     """Add sensors for passed config_entry in HA."""
     coord = config_entry.runtime_data
     new_entities = [SLSensor(coord, desc) for desc in SENSOR_DESCRIPTIONS]
+    new_entities += [
+        SLMetricSensor(coord, desc) for desc in METRIC_SENSOR_DESCRIPTIONS
+    ]
     if new_entities:
         async_add_entities(new_entities)
 
@@ -53,10 +98,47 @@ async def async_setup_entry(
 class SLSensor(SensorEntity, SLEntity):
     """Sensor class."""
 
+    _written = None
+
+    @property
+    def history_key(self) -> str:
+        """Signal type history."""
+        return SENSOR_MAP[self.entity_description.key]
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
         dev_sensor = SENSOR_MAP[self.entity_description.key]
         self._attr_native_value = self.coordinator.device.get_data_value(dev_sensor)
+        # Most updates are for other keys, only write our own changes.
+        written = (self._attr_native_value, self.available)
+        if written == self._written:
+            return
+        self._written = written
         self.async_write_ha_state()
+
+
+class SLMetricSensor(SensorEntity, SLEntity):
+    """Protocol metric sensor, sampled on a timer rather than per line."""
+
+    async def async_added_to_hass(self) -> None:
+        """Start sampling."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_sample, timedelta(seconds=SL_METRICS_INTERVAL)
+            )
+        )
+        self._async_sample()
+
+    @callback
+    def _async_sample(self, now: datetime | None = None) -> None:
+        """Read the metric and write state."""
+        metrics = self.coordinator.device.metrics
+        self._attr_native_value = getattr(metrics, self.entity_description.key)
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Metrics are sampled on the timer."""
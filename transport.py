@@ -0,0 +1,81 @@
+"""Line framing transport for the SL protocol."""
+
+import asyncio
+from collections.abc import Callable
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+SL_LINE_TERMINATOR = 13  # b"\r"
+SL_MAX_LINE = 4096
+
+
+class SLProtocol(asyncio.Protocol):
+    """Split \\r framed lines out of one reusable buffer.
+
+    Each line is handed to on_line as a memoryview into the buffer, without
+    the terminator. The view is released once on_line returns, so it must
+    not be kept.
+    """
+
+    def __init__(
+        self,
+        on_line: Callable[[memoryview], None],
+        on_lost: Callable[[Exception | None], None],
+        on_overflow: Callable[[int], None],
+    ) -> None:
+        """Set up buffer."""
+        self._on_line = on_line
+        self._on_lost = on_lost
+        self._on_overflow = on_overflow
+        self._buf = bytearray()
+        self._discarding = False
+        self._transport: asyncio.Transport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Remember the transport."""
+        self._transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        """Frame and dispatch complete lines."""
+        if self._discarding:
+            # Rest of an overlong line, drop it up to its terminator.
+            end = data.find(SL_LINE_TERMINATOR)
+            if end < 0:
+                return
+            self._discarding = False
+            data = data[end + 1 :]
+        buf = self._buf
+        buf += data
+        end = buf.find(SL_LINE_TERMINATOR)
+        if end >= 0:
+            start = 0
+            with memoryview(buf) as view:
+                while end >= 0:
+                    if end - start > SL_MAX_LINE:
+                        self._on_overflow(end - start)
+                    else:
+                        line = view[start:end]
+                        try:
+                            self._on_line(line)
+                        finally:
+                            line.release()
+                    start = end + 1
+                    end = buf.find(SL_LINE_TERMINATOR, start)
+            del buf[:start]
+        if len(buf) > SL_MAX_LINE:
+            self._on_overflow(len(buf))
+            buf.clear()
+            self._discarding = True
+
+    def eof_received(self) -> bool | None:
+        """Let the transport close itself."""
+        _LOGGER.debug("Connection closed by device")
+        return None
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Drop the buffer and tell the owner."""
+        self._buf.clear()
+        self._discarding = False
+        self._transport = None
+        self._on_lost(exc)